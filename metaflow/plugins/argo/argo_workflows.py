@@ -1,4 +1,5 @@
 import base64
+import functools
 import json
 import os
 import re
@@ -64,6 +65,14 @@ from metaflow.util import (
 from .argo_client import ArgoClient
 
 
+@functools.lru_cache(maxsize=4)
+def _get_argo_client(namespace):
+    # Constructing an ArgoClient loads the kubeconfig (or in-cluster config)
+    # every time; share one client per namespace within a process instead.
+    # The underlying KubernetesClient refreshes its credentials periodically.
+    return ArgoClient(namespace=namespace)
+
+
 class ArgoWorkflowsException(MetaflowException):
     headline = "Argo Workflows error"
 
@@ -171,7 +180,7 @@ class ArgoWorkflows(object):
     def deploy(self):
         try:
             # Register workflow template.
-            ArgoClient(namespace=KUBERNETES_NAMESPACE).register_workflow_template(
+            _get_argo_client(KUBERNETES_NAMESPACE).register_workflow_template(
                 self.name, self._workflow_template.to_json()
             )
         except Exception as e:
@@ -192,7 +201,7 @@ class ArgoWorkflows(object):
 
     @staticmethod
     def list_templates(flow_name, all=False):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
 
         templates = client.get_workflow_templates()
         if templates is None:
@@ -211,7 +220,7 @@ class ArgoWorkflows(object):
 
     @staticmethod
     def delete(name):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
 
         # Always try to delete the schedule. Failure in deleting the schedule should not
         # be treated as an error, due to any of the following reasons
@@ -237,7 +246,7 @@ class ArgoWorkflows(object):
 
     @classmethod
     def terminate(cls, flow_name, name):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
 
         response = client.terminate_workflow(name)
         if response is None:
@@ -249,7 +258,7 @@ class ArgoWorkflows(object):
 
     @staticmethod
     def get_workflow_status(flow_name, name):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
         # TODO: Only look for workflows for the specified flow
         workflow = client.get_workflow(name)
         if workflow:
@@ -265,7 +274,7 @@ class ArgoWorkflows(object):
 
     @staticmethod
     def suspend(name):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
 
         client.suspend_workflow(name)
 
@@ -273,7 +282,7 @@ class ArgoWorkflows(object):
 
     @staticmethod
     def unsuspend(name):
-        client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+        client = _get_argo_client(KUBERNETES_NAMESPACE)
 
         client.unsuspend_workflow(name)
 
@@ -284,8 +293,8 @@ class ArgoWorkflows(object):
         if parameters is None:
             parameters = {}
         try:
-            workflow_template = ArgoClient(
-                namespace=KUBERNETES_NAMESPACE
+            workflow_template = _get_argo_client(
+                KUBERNETES_NAMESPACE
             ).get_workflow_template(name)
         except Exception as e:
             raise ArgoWorkflowsException(str(e))
@@ -306,7 +315,7 @@ class ArgoWorkflows(object):
                     "Workflows before proceeding." % name
                 )
         try:
-            return ArgoClient(namespace=KUBERNETES_NAMESPACE).trigger_workflow_template(
+            return _get_argo_client(KUBERNETES_NAMESPACE).trigger_workflow_template(
                 name, parameters
             )
         except Exception as e:
@@ -335,7 +344,7 @@ class ArgoWorkflows(object):
 
     def schedule(self):
         try:
-            argo_client = ArgoClient(namespace=KUBERNETES_NAMESPACE)
+            argo_client = _get_argo_client(KUBERNETES_NAMESPACE)
             argo_client.schedule_workflow_template(
                 self.name, self._schedule, self._timezone
             )
@@ -388,8 +397,8 @@ class ArgoWorkflows(object):
 
     @classmethod
     def get_existing_deployment(cls, name):
-        workflow_template = ArgoClient(
-            namespace=KUBERNETES_NAMESPACE
+        workflow_template = _get_argo_client(
+            KUBERNETES_NAMESPACE
         ).get_workflow_template(name)
         if workflow_template is not None:
             try:
@@ -410,7 +419,7 @@ class ArgoWorkflows(object):
 
     @classmethod
     def get_execution(cls, name):
-        workflow = ArgoClient(namespace=KUBERNETES_NAMESPACE).get_workflow(name)
+        workflow = _get_argo_client(KUBERNETES_NAMESPACE).get_workflow(name)
         if workflow is not None:
             try:
                 return (
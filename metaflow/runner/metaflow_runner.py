@@ -1,32 +1,172 @@
+import functools
 import importlib
 import os
+import selectors
 import sys
 import tempfile
 import time
-from typing import Dict, Iterator, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from metaflow import Run, metadata
 
 from .subprocess_manager import CommandManager, SubprocessManager
 
 
+class RunnerAttributeMissingError(Exception):
+    """Exception raised when the runner attribute is never written."""
+
+
 def clear_and_set_os_environ(env: Dict):
     os.environ.clear()
     os.environ.update(env)
 
 
-def read_from_file_when_ready(file_path: str, timeout: float = 5):
-    start_time = time.time()
-    with open(file_path, "r", encoding="utf-8") as file_pointer:
-        content = file_pointer.read()
-        while not content:
-            if time.time() - start_time > timeout:
-                raise TimeoutError(
-                    "Timeout while waiting for file content from '%s'" % file_path
-                )
-            time.sleep(0.1)
-            content = file_pointer.read()
-        return content
+@contextmanager
+def temporary_fifo() -> Iterator[Tuple[str, int]]:
+    """
+    Create a temporary FIFO and open its read side in non-blocking mode.
+
+    Yields
+    ------
+    Tuple[str, int]
+        The path to the FIFO (to be handed to the writer) and the file
+        descriptor of its read side.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "fifo")
+        os.mkfifo(path)
+        # Opening the read side in non-blocking mode returns immediately even
+        # though there is no writer yet, and lets the writer open its side
+        # without blocking.
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            yield path, fd
+        finally:
+            # Remove the FIFO before closing the read side: a writer opening
+            # the path once no reader exists would otherwise block forever.
+            os.unlink(path)
+            os.close(fd)
+
+
+def open_process_fd(pid: int) -> Optional[int]:
+    """
+    Get a file descriptor that becomes readable when the process `pid` exits.
+
+    This relies on `pidfd_open` (Linux 5.3+, Python 3.9+); None is returned
+    where it is not available or if the process no longer exists.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def has_exited(process) -> bool:
+    # a 'subprocess.Popen' only notices its exit when polled, while an asyncio
+    # process gets its return code from the event loop
+    if hasattr(process, "poll"):
+        return process.poll() is not None
+    return process.returncode is not None
+
+
+def drain_fifo(fifo_fd: int, content: bytearray) -> bool:
+    """
+    Append everything currently available in the FIFO to `content`.
+
+    Returns True if the writer has closed its side (or never opened it).
+    """
+    while True:
+        try:
+            data = os.read(fifo_fd, 8192)
+        except BlockingIOError:
+            return False
+        if not data:
+            return True
+        content += data
+
+
+def read_from_fifo_when_ready(
+    fifo_fd: int,
+    command_obj: CommandManager,
+    timeout: float = 5,
+    encoding: str = "utf-8",
+) -> str:
+    content = bytearray()
+    deadline = time.monotonic() + timeout
+    process = command_obj.process
+    exited = process.returncode is not None
+    process_fd = None if exited else open_process_fd(process.pid)
+    try:
+        with selectors.DefaultSelector() as selector:
+            # wait on both the FIFO and the process, whichever happens first
+            selector.register(fifo_fd, selectors.EVENT_READ)
+            if process_fd is not None:
+                selector.register(process_fd, selectors.EVENT_READ)
+            while True:
+                if exited:
+                    # the process is gone, so whatever it wrote is in the FIFO
+                    drain_fifo(fifo_fd, content)
+                    if content:
+                        break
+                    raise RunnerAttributeMissingError(
+                        "The process (PID %d; command: '%s') exited without writing "
+                        "its runner attribute"
+                        % (process.pid, " ".join(command_obj.command))
+                    )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "Timeout while waiting for content from the runner "
+                        "attribute FIFO"
+                    )
+                if process_fd is None:
+                    # without a process fd, check on the process periodically
+                    remaining = min(remaining, 0.1)
+                events = selector.select(remaining)
+                if process_fd is not None and any(
+                    key.fd == process_fd for key, _ in events
+                ):
+                    exited = True
+                    continue
+                if events and drain_fifo(fifo_fd, content):
+                    if content:
+                        # the writer closed its side after writing
+                        break
+                    # no writer has connected yet -- some platforms report
+                    # such a FIFO as readable, so back off instead of spinning.
+                    time.sleep(0.1)
+                if process_fd is None:
+                    exited = has_exited(process)
+    finally:
+        if process_fd is not None:
+            os.close(process_fd)
+    return content.decode(encoding)
+
+
+@functools.lru_cache(maxsize=32)
+def get_metaflow_api(flow_file: str):
+    # these imports are required here and not at the top
+    # since they interfere with the user defined Parameters
+    # in the flow file, this is related to the ability of
+    # importing 'Runner' directly i.e.
+    #    from metaflow import Runner
+    # This ability is made possible by the statement:
+    # 'from .metaflow_runner import Runner' in '__init__.py'
+
+    # 'MetaflowAPI.from_cli' adds the flow's parameters and decorator options
+    # to the click commands in 'metaflow.cli', so that module needs a fresh
+    # reload before building the API of another flow. The resulting API doesn't
+    # depend on the module afterwards, so we build it only once per flow file
+    # (the flow module itself is already cached per flow file by click_api).
+    if "metaflow.cli" in sys.modules:
+        importlib.reload(sys.modules["metaflow.cli"])
+    from metaflow.cli import start
+    from metaflow.runner.click_api import MetaflowAPI
+
+    return MetaflowAPI.from_cli(flow_file, start)
 
 
 class ExecutingRun(object):
@@ -244,19 +384,6 @@ class Runner(object):
         cwd: Optional[str] = None,
         **kwargs
     ):
-        # these imports are required here and not at the top
-        # since they interfere with the user defined Parameters
-        # in the flow file, this is related to the ability of
-        # importing 'Runner' directly i.e.
-        #    from metaflow import Runner
-        # This ability is made possible by the statement:
-        # 'from .metaflow_runner import Runner' in '__init__.py'
-
-        if "metaflow.cli" in sys.modules:
-            importlib.reload(sys.modules["metaflow.cli"])
-        from metaflow.cli import start
-        from metaflow.runner.click_api import MetaflowAPI
-
         self.flow_file = flow_file
         self.show_output = show_output
 
@@ -269,7 +396,7 @@ class Runner(object):
         self.cwd = cwd
         self.spm = SubprocessManager()
         self.top_level_kwargs = kwargs
-        self.api = MetaflowAPI.from_cli(self.flow_file, start)
+        self.api = get_metaflow_api(self.flow_file)
 
     def __enter__(self) -> "Runner":
         return self
@@ -277,7 +404,24 @@ class Runner(object):
     async def __aenter__(self) -> "Runner":
         return self
 
-    def __get_executing_run(self, tfp_runner_attribute, command_obj):
+    def __spawn(self, command: List[str]) -> CommandManager:
+        pid = self.spm.run_command(
+            [sys.executable, *command],
+            env=self.env_vars,
+            cwd=self.cwd,
+            show_output=self.show_output,
+        )
+        return self.spm.get(pid)
+
+    async def __async_spawn(self, command: List[str]) -> CommandManager:
+        pid = await self.spm.async_run_command(
+            [sys.executable, *command],
+            env=self.env_vars,
+            cwd=self.cwd,
+        )
+        return self.spm.get(pid)
+
+    def __get_executing_run(self, attribute_file_fd, command_obj):
         # When two 'Runner' executions are done sequentially i.e. one after the other
         # the 2nd run kinda uses the 1st run's previously set metadata and
         # environment variables.
@@ -289,12 +433,14 @@ class Runner(object):
             clear_and_set_os_environ(self.old_env)
 
             # Set the correct metadata from the runner_attribute file corresponding to this run.
-            content = read_from_file_when_ready(tfp_runner_attribute.name, timeout=10)
+            content = read_from_fifo_when_ready(
+                attribute_file_fd, command_obj, timeout=10
+            )
             metadata_for_flow, pathspec = content.rsplit(":", maxsplit=1)
             metadata(metadata_for_flow)
             run_object = Run(pathspec, _namespace_check=False)
             return ExecutingRun(self, command_obj, run_object)
-        except TimeoutError as e:
+        except (TimeoutError, RunnerAttributeMissingError) as e:
             stdout_log = open(command_obj.log_files["stdout"]).read()
             stderr_log = open(command_obj.log_files["stderr"]).read()
             command = " ".join(command_obj.command)
@@ -321,23 +467,14 @@ class Runner(object):
         ExecutingRun
             ExecutingRun containing the results of the run.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tfp_runner_attribute = tempfile.NamedTemporaryFile(
-                dir=temp_dir, delete=False
-            )
+        with temporary_fifo() as (attribute_file_path, attribute_file_fd):
             command = self.api(**self.top_level_kwargs).run(
-                runner_attribute_file=tfp_runner_attribute.name, **kwargs
+                runner_attribute_file=attribute_file_path, **kwargs
             )
 
-            pid = self.spm.run_command(
-                [sys.executable, *command],
-                env=self.env_vars,
-                cwd=self.cwd,
-                show_output=self.show_output,
-            )
-            command_obj = self.spm.get(pid)
+            command_obj = self.__spawn(command)
 
-            return self.__get_executing_run(tfp_runner_attribute, command_obj)
+            return self.__get_executing_run(attribute_file_fd, command_obj)
 
     def resume(self, **kwargs):
         """
@@ -355,23 +492,14 @@ class Runner(object):
         ExecutingRun
             ExecutingRun containing the results of the resumed run.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tfp_runner_attribute = tempfile.NamedTemporaryFile(
-                dir=temp_dir, delete=False
-            )
+        with temporary_fifo() as (attribute_file_path, attribute_file_fd):
             command = self.api(**self.top_level_kwargs).resume(
-                runner_attribute_file=tfp_runner_attribute.name, **kwargs
+                runner_attribute_file=attribute_file_path, **kwargs
             )
 
-            pid = self.spm.run_command(
-                [sys.executable, *command],
-                env=self.env_vars,
-                cwd=self.cwd,
-                show_output=self.show_output,
-            )
-            command_obj = self.spm.get(pid)
+            command_obj = self.__spawn(command)
 
-            return self.__get_executing_run(tfp_runner_attribute, command_obj)
+            return self.__get_executing_run(attribute_file_fd, command_obj)
 
     async def async_run(self, **kwargs) -> ExecutingRun:
         """
@@ -391,22 +519,14 @@ class Runner(object):
         ExecutingRun
             ExecutingRun representing the run that was started.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tfp_runner_attribute = tempfile.NamedTemporaryFile(
-                dir=temp_dir, delete=False
-            )
+        with temporary_fifo() as (attribute_file_path, attribute_file_fd):
             command = self.api(**self.top_level_kwargs).run(
-                runner_attribute_file=tfp_runner_attribute.name, **kwargs
+                runner_attribute_file=attribute_file_path, **kwargs
             )
 
-            pid = await self.spm.async_run_command(
-                [sys.executable, *command],
-                env=self.env_vars,
-                cwd=self.cwd,
-            )
-            command_obj = self.spm.get(pid)
+            command_obj = await self.__async_spawn(command)
 
-            return self.__get_executing_run(tfp_runner_attribute, command_obj)
+            return self.__get_executing_run(attribute_file_fd, command_obj)
 
     async def async_resume(self, **kwargs):
         """
@@ -426,22 +546,14 @@ class Runner(object):
         ExecutingRun
             ExecutingRun representing the resumed run that was started.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tfp_runner_attribute = tempfile.NamedTemporaryFile(
-                dir=temp_dir, delete=False
-            )
+        with temporary_fifo() as (attribute_file_path, attribute_file_fd):
             command = self.api(**self.top_level_kwargs).resume(
-                runner_attribute_file=tfp_runner_attribute.name, **kwargs
+                runner_attribute_file=attribute_file_path, **kwargs
             )
 
-            pid = await self.spm.async_run_command(
-                [sys.executable, *command],
-                env=self.env_vars,
-                cwd=self.cwd,
-            )
-            command_obj = self.spm.get(pid)
+            command_obj = await self.__async_spawn(command)
 
-            return self.__get_executing_run(tfp_runner_attribute, command_obj)
+            return self.__get_executing_run(attribute_file_fd, command_obj)
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.spm.cleanup()
@@ -99,11 +99,10 @@ class NBRunner(object):
         self.flow = flow
         self.show_output = show_output
 
-        self.env_vars = os.environ.copy()
-        self.env_vars.update(env or {})
+        # only the overrides are passed on, 'Runner' layers them on top of
+        # the current environment (and takes care of the profile)
+        self.env_vars = dict(env or {})
         self.env_vars.update({"JPY_PARENT_PID": ""})
-        if profile:
-            self.env_vars["METAFLOW_PROFILE"] = profile
 
         self.base_dir = base_dir
 
@@ -160,7 +160,9 @@ class CommandManager(object):
         """
         self.command = command
 
-        self.env = env if env is not None else os.environ.copy()
+        # when no environment is given, the subprocess simply inherits ours --
+        # no need to copy os.environ for that
+        self.env = env
         self.cwd = cwd if cwd is not None else os.getcwd()
 
         self.process = None
@@ -0,0 +1,59 @@
+import pytest
+
+from metaflow import Runner
+from metaflow.runner.metaflow_runner import get_metaflow_api
+
+FLOW_TEMPLATE = """
+from metaflow import FlowSpec, Parameter, step
+
+
+class {name}(FlowSpec):
+    {param} = Parameter("{param}", default=1)
+
+    @step
+    def start(self):
+        self.next(self.end)
+
+    @step
+    def end(self):
+        pass
+
+
+if __name__ == "__main__":
+    {name}()
+"""
+
+
+def write_flow(tmp_path, name, param):
+    flow_file = tmp_path / ("%s.py" % name.lower())
+    flow_file.write_text(FLOW_TEMPLATE.format(name=name, param=param))
+    return str(flow_file)
+
+
+def assert_accepts_only(runner, param, other_param):
+    command = runner.api().run(**{param: 5})
+    assert "--%s" % param in command
+    with pytest.raises(ValueError):
+        runner.api().run(**{other_param: 5})
+
+
+def test_api_is_cached_per_flow_file(tmp_path):
+    flow_a = write_flow(tmp_path, "AlphaFlow", "alpha")
+    flow_b = write_flow(tmp_path, "BetaFlow", "beta")
+    get_metaflow_api.cache_clear()
+
+    runner_a = Runner(flow_a)
+    assert_accepts_only(runner_a, "alpha", "beta")
+
+    # building the API for another flow reloads 'metaflow.cli'
+    runner_b = Runner(flow_b)
+    assert_accepts_only(runner_b, "beta", "alpha")
+
+    # the cached API of the first flow is unaffected by that reload
+    runner_a_again = Runner(flow_a)
+    assert runner_a_again.api is runner_a.api
+    assert_accepts_only(runner_a_again, "alpha", "beta")
+
+    cache_info = get_metaflow_api.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
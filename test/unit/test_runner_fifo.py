@@ -0,0 +1,131 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from metaflow.runner import metaflow_runner
+from metaflow.runner.metaflow_runner import (
+    RunnerAttributeMissingError,
+    read_from_fifo_when_ready,
+    temporary_fifo,
+)
+
+
+@pytest.fixture(params=["pidfd", "no_pidfd"])
+def process_fd_mode(request, monkeypatch):
+    if request.param == "pidfd":
+        if not hasattr(os, "pidfd_open"):
+            pytest.skip("pidfd_open is not available on this platform")
+    else:
+        monkeypatch.setattr(metaflow_runner, "open_process_fd", lambda pid: None)
+    return request.param
+
+
+class FakeCommand(object):
+    def __init__(self, process, command=None):
+        self.process = process
+        self.command = command if command is not None else process.args
+
+
+def spawn_writer(path, content, delay=0.0, linger=0.0):
+    # write `content` to `path` after `delay` seconds, then keep running
+    # for `linger` more seconds
+    script = (
+        "import sys, time\n"
+        "time.sleep(float(sys.argv[3]))\n"
+        "with open(sys.argv[1], 'w') as f:\n"
+        "    f.write(sys.argv[2])\n"
+        "time.sleep(float(sys.argv[4]))\n"
+    )
+    return subprocess.Popen(
+        [sys.executable, "-c", script, path, content, str(delay), str(linger)]
+    )
+
+
+def test_fifo_writer_writes_and_closes(process_fd_mode):
+    with temporary_fifo() as (path, fd):
+        process = spawn_writer(path, "local@/tmp:HelloFlow/1", linger=1)
+        try:
+            content = read_from_fifo_when_ready(fd, FakeCommand(process), timeout=10)
+        finally:
+            process.wait()
+    assert content == "local@/tmp:HelloFlow/1"
+
+
+def test_fifo_writer_connects_late(process_fd_mode):
+    with temporary_fifo() as (path, fd):
+        process = spawn_writer(path, "local@/tmp:HelloFlow/2", delay=0.5)
+        try:
+            content = read_from_fifo_when_ready(fd, FakeCommand(process), timeout=10)
+        finally:
+            process.wait()
+    assert content == "local@/tmp:HelloFlow/2"
+
+
+def test_fifo_timeout(process_fd_mode):
+    with temporary_fifo() as (path, fd):
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        try:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                read_from_fifo_when_ready(fd, FakeCommand(process), timeout=0.5)
+            assert time.monotonic() - start < 5
+        finally:
+            process.kill()
+            process.wait()
+
+
+def test_fifo_is_removed_on_exit():
+    with temporary_fifo() as (path, fd):
+        assert os.path.exists(path)
+    assert not os.path.exists(path)
+
+
+def test_fifo_exited_process_without_writing():
+    # synchronous runs have already reaped the process when reading the FIFO
+    with temporary_fifo() as (path, fd):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        with pytest.raises(RunnerAttributeMissingError):
+            read_from_fifo_when_ready(fd, FakeCommand(process), timeout=10)
+
+
+def test_fifo_process_exits_without_writing(process_fd_mode):
+    with temporary_fifo() as (path, fd):
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(0.5)"]
+        )
+        try:
+            start = time.monotonic()
+            with pytest.raises(RunnerAttributeMissingError):
+                read_from_fifo_when_ready(fd, FakeCommand(process), timeout=10)
+            assert time.monotonic() - start < 5
+        finally:
+            process.wait()
+
+
+def test_fifo_async_process_exits_without_writing(process_fd_mode):
+    async def run():
+        with temporary_fifo() as (path, fd):
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-c", "import time; time.sleep(0.5)"
+            )
+            command_obj = FakeCommand(process, [sys.executable])
+            try:
+                if process_fd_mode == "pidfd":
+                    with pytest.raises(RunnerAttributeMissingError):
+                        read_from_fifo_when_ready(fd, command_obj, timeout=10)
+                else:
+                    # the return code of an asyncio process is only set by the
+                    # (blocked) event loop, so only the timeout can fire here
+                    with pytest.raises(TimeoutError):
+                        read_from_fifo_when_ready(fd, command_obj, timeout=1)
+            finally:
+                await process.wait()
+
+    asyncio.run(run())